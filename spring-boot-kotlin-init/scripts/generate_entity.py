@@ -9,36 +9,62 @@ Generates JPA entity classes following the project conventions:
 - Proper annotations
 """
 
+import io
+import json
 import sys
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import List, TextIO
+
+# Maps a dotted package name to its directory path
+_PKG_TRANS = str.maketrans('.', '/')
+
+# Example fields (in real usage, these would be provided or prompted)
+_EXAMPLE_FIELDS = [
+    ("name", "String", False),
+    ("email", "String", False),
+    ("phoneNumber", "String", True),
+]
+
+_camel_cache: dict = {}
+_snake_cache: dict = {}
 
 def to_camel_case(snake_str: str) -> str:
     """Convert snake_case to CamelCase"""
-    components = snake_str.split('_')
-    return ''.join(x.title() for x in components)
+    result = _camel_cache.get(snake_str)
+    if result is not None:
+        return result
+    
+    # Upper-case only the first letter of each part; the rest is kept as is
+    result = ''.join(c[:1].upper() + c[1:] for c in snake_str.split('_'))
+    _camel_cache[snake_str] = result
+    return result
 
 def to_snake_case(camel_str: str) -> str:
     """Convert CamelCase to snake_case"""
-    import re
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', camel_str)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-
-def generate_entity(entity_name: str, package_name: str, fields: list) -> str:
-    """
-    Generate entity class code
-    
-    Args:
-        entity_name: Name of the entity (e.g., 'Member')
-        package_name: Base package name (e.g., 'com.example.demo')
-        fields: List of (field_name, field_type, nullable) tuples
+    result = _snake_cache.get(camel_str)
+    if result is not None:
+        return result
     
-    Returns:
-        Generated Kotlin code as string
-    """
-    table_name = to_snake_case(entity_name)
+    # Underscore before an uppercase letter that follows a lowercase letter
+    # or digit, or that starts a new word (e.g. 'HTTPServer' -> 'http_server')
+    out = [camel_str[:1]]
+    last = len(camel_str) - 1
+    for i in range(1, len(camel_str)):
+        c = camel_str[i]
+        if 'A' <= c <= 'Z':
+            prev = camel_str[i - 1]
+            if ('a' <= prev <= 'z' or '0' <= prev <= '9'
+                    or (i < last and 'a' <= camel_str[i + 1] <= 'z')):
+                out.append('_')
+        out.append(c)
     
-    template = f"""package {package_name}.domain
+    result = ''.join(out).lower()
+    _snake_cache[camel_str] = result
+    return result
+
+_ENTITY_HEADER_FMT = """package {package_name}.domain
 
 import io.hypersistence.utils.hibernate.id.Tsid
 import jakarta.persistence.*
@@ -55,34 +81,161 @@ class {entity_name}(
     var id: String? = null,
     
 """
+
+_ENTITY_FOOTER_FMT = """): BaseEntity() {{
+    
+    companion object {{
+        fun of(/* Add parameters */): {entity_name} {{
+            return {entity_name}(
+                // Initialize fields
+            )
+        }}
+    }}
+}}
+"""
+
+def write_entity(out: TextIO, entity_name: str, package_name: str, fields: list) -> None:
+    """
+    Write entity class code to a text stream piece by piece
+    
+    Args:
+        out: Writable text stream (e.g., an open file)
+        entity_name: Name of the entity (e.g., 'Member')
+        package_name: Base package name (e.g., 'com.example.demo')
+        fields: List of (field_name, field_type, nullable) tuples
+    """
+    table_name = to_snake_case(entity_name)
+    write = out.write
+    
+    write(_ENTITY_HEADER_FMT.format(
+        package_name=package_name,
+        entity_name=entity_name,
+        table_name=table_name,
+    ))
     
     # Add fields
     for field_name, field_type, nullable in fields:
         null_annotation = "" if nullable else "nullable = false, "
         null_marker = "?" if nullable else ""
         
-        template += f"""    @Column({null_annotation}length = 255)
+        write(f"""    @Column({null_annotation}length = 255)
     var {field_name}: {field_type}{null_marker},
     
-"""
+""")
+    
+    write(_ENTITY_FOOTER_FMT.format(entity_name=entity_name))
+
+def generate_entity(entity_name: str, package_name: str, fields: list) -> str:
+    """
+    Generate entity class code
     
-    template += """): BaseEntity() {
+    Args:
+        entity_name: Name of the entity (e.g., 'Member')
+        package_name: Base package name (e.g., 'com.example.demo')
+        fields: List of (field_name, field_type, nullable) tuples
     
-    companion object {
-        fun of(/* Add parameters */): ENTITY_NAME {
-            return ENTITY_NAME(
-                // Initialize fields
-            )
-        }
-    }
-}
-""".replace("ENTITY_NAME", entity_name)
+    Returns:
+        Generated Kotlin code as string
+    """
+    buf = io.StringIO()
+    write_entity(buf, entity_name, package_name, fields)
+    return buf.getvalue()
+
+@dataclass
+class EntitySpec:
+    """Input for one entity in a batch run"""
+    entity_name: str
+    package_name: str
+    output_dir: str = "src/main/kotlin"
+    fields: list = field(default_factory=lambda: list(_EXAMPLE_FIELDS))
     
-    return template
+    def __post_init__(self):
+        for name in ("entity_name", "package_name", "output_dir"):
+            if not isinstance(getattr(self, name), str):
+                raise TypeError(f"{name} must be a string")
+        
+        # Both end up in file paths, so only plain identifiers are allowed
+        if not self.entity_name.isidentifier():
+            raise ValueError(f"entity_name is not a valid class name: {self.entity_name!r}")
+        if not all(part.isidentifier() for part in self.package_name.split('.')):
+            raise ValueError(f"package_name is not a valid package: {self.package_name!r}")
+        
+        if not isinstance(self.fields, list):
+            raise TypeError("fields must be a list")
+        checked = []
+        for item in self.fields:
+            if not isinstance(item, (list, tuple)) or len(item) != 3:
+                raise ValueError(f"field must be [name, type, nullable]: {item!r}")
+            field_name, field_type, nullable = item
+            if not (isinstance(field_name, str) and isinstance(field_type, str)
+                    and isinstance(nullable, bool)):
+                raise TypeError(f"field must be [str, str, bool]: {item!r}")
+            checked.append((field_name, field_type, nullable))
+        self.fields = checked
+
+def generate_many(specs: List[EntitySpec]) -> List[Path]:
+    """
+    Generate several entity files in one process
+    
+    Each domain directory is created at most once per call. Every
+    file is rendered in full before it is written, so a failure never
+    leaves a truncated .kt file behind.
+    
+    Returns:
+        Paths of the written files, in input order
+    """
+    seen_dirs = set()
+    written = []
+    
+    for spec in specs:
+        domain_dir = Path(spec.output_dir) / spec.package_name.translate(_PKG_TRANS) / "domain"
+        if domain_dir not in seen_dirs:
+            domain_dir.mkdir(parents=True, exist_ok=True)
+            seen_dirs.add(domain_dir)
+        
+        output_file = domain_dir / f"{spec.entity_name}.kt"
+        code = generate_entity(spec.entity_name, spec.package_name, spec.fields)
+        output_file.write_text(code, encoding='utf-8')
+        written.append(output_file)
+    
+    return written
+
+def main_batch():
+    """
+    Read a JSON list of entity specs from stdin and generate them all
+    
+    Example input:
+        [{"entity_name": "Member", "package_name": "com.example.demo",
+          "output_dir": "src/main/kotlin",
+          "fields": [["name", "String", false], ["nickname", "String", true]]}]
+    """
+    # Validate every spec before writing anything
+    try:
+        data = json.load(sys.stdin)
+        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+            raise ValueError("expected a JSON list of entity objects")
+        specs = [EntitySpec(**item) for item in data]
+    except (TypeError, ValueError) as e:
+        print(f"❌ Invalid batch input: {e}")
+        sys.exit(1)
+    
+    try:
+        written = generate_many(specs)
+    except OSError as e:
+        print(f"❌ Failed to write entity: {e}")
+        sys.exit(1)
+    
+    for output_file in written:
+        print(f"✅ Generated entity: {output_file}")
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        main_batch()
+        return
+    
     if len(sys.argv) < 4:
         print("Usage: generate_entity.py <entity_name> <package_name> <output_dir>")
+        print("       generate_entity.py --batch < entities.json")
         print("Example: generate_entity.py Member com.example.demo src/main/kotlin")
         sys.exit(1)
     
@@ -90,23 +243,17 @@ def main():
     package_name = sys.argv[2]
     output_dir = sys.argv[3]
     
-    # Example fields (in real usage, these would be provided or prompted)
-    fields = [
-        ("name", "String", False),
-        ("email", "String", False),
-        ("phoneNumber", "String", True),
-    ]
-    
-    code = generate_entity(entity_name, package_name, fields)
+    fields = _EXAMPLE_FIELDS
     
     # Create output directory
-    package_path = package_name.replace('.', '/')
+    package_path = package_name.translate(_PKG_TRANS)
     domain_dir = Path(output_dir) / package_path / "domain"
     domain_dir.mkdir(parents=True, exist_ok=True)
     
     # Write file
     output_file = domain_dir / f"{entity_name}.kt"
-    output_file.write_text(code)
+    with output_file.open('w', encoding='utf-8') as f:
+        write_entity(f, entity_name, package_name, fields)
     
     print(f"✅ Generated entity: {output_file}")
     print(f"📝 Remember to:")
@@ -11,6 +11,9 @@ Generates domain-specific exception classes following project conventions:
 import sys
 from pathlib import Path
 
+# Maps a dotted package name to its directory path
+_PKG_TRANS = str.maketrans('.', '/')
+
 def generate_exception(exception_name: str, package_name: str, message: str, error_code: str) -> str:
     """Generate custom exception class"""
     
@@ -90,7 +93,7 @@ def main():
     code = generate_exception(exception_name, package_name, message, error_code)
     
     # Create output directory
-    package_path = package_name.replace('.', '/')
+    package_path = package_name.translate(_PKG_TRANS)
     exception_dir = Path(output_dir) / package_path / "exception"
     exception_dir.mkdir(parents=True, exist_ok=True)
     
@@ -10,10 +10,48 @@ Checks for:
 """
 
 import re
+from collections import defaultdict
+from functools import cached_property
 from typing import Set, Dict, Tuple, List
 from pathlib import Path
 
 
+# Precompiled patterns shared by every TestImplMatcher instance.
+# Test and implementation sources are each scanned once with a single
+# alternation; the named group that matched tells which construct was found.
+#
+# Spans that other constructs may overlap (call args, params, names, throws
+# lists) are captured through lookaheads so nothing inside them is skipped.
+#
+# Test side:
+# - service.methodName(...) or repository.methodName(...)
+# - fun testName(...) or @Test fun method()
+# - class ..ServiceTest / ..RepositoryTest / ..ControllerTest
+_TEST_MULTI = re.compile(
+    r'(?P<obj>\w+)?\.(?P<call>\w+)\s*\((?=(?P<args>.*?)\))?'
+    r'|fun\s+(?P<testfn>(?:test|should|when)\w*)\s*\('
+    r'|class\s+(?=(?P<entity>\w+)(?:ServiceTest|RepositoryTest|ControllerTest))'
+)
+# Implementation side:
+# - fun methodName(params)
+# - throws A, B
+_IMPL_MULTI = re.compile(
+    r'fun\s+(?P<fun>\w+)\s*\((?=(?P<params>.*?)\))?'
+    r'|throws\s+(?=(?P<throws>\w+(?:\s*,\s*\w+)*))'
+)
+# Exception assertions are found with plain substring search instead of a
+# DOTALL regex: assertThatThrownBy ... .isInstanceOf(ExceptionName
+_ASSERT_START = 'assertThatThrownBy'
+_ASSERT_TYPE = '.isInstanceOf('
+
+# Common test helpers that never live in the implementation
+_HELPER_METHODS = frozenset({
+    'assertEquals', 'assertTrue', 'assertFalse', 'reset', 'given', 'verify'
+})
+# Methods inherited from Any/Object that don't need dedicated tests
+_OBJECT_METHODS = frozenset({'equals', 'hashCode', 'toString', 'getClass'})
+
+
 class TestImplMatcher:
     """Validates test and implementation consistency."""
     
@@ -23,74 +61,148 @@ class TestImplMatcher:
         self.errors: List[str] = []
         self.warnings: List[str] = []
     
-    def extract_method_calls(self) -> Dict[str, Set[str]]:
-        """Extract method calls from test code by class."""
-        calls_by_class = {}
+    @cached_property
+    def _test_scan(self) -> Tuple[Dict[str, Set[str]], Dict[str, str], Set[str], Set[str]]:
+        """Scan test code once for calls, call args, test methods and entities."""
+        calls: Dict[str, Set[str]] = defaultdict(set)
+        test_calls: Dict[str, str] = {}
+        tests: Set[str] = set()
+        entities: Set[str] = set()
+        # A captured args span counts as consumed: the next one may only
+        # start past it
+        sig_end = 0
         
-        # Find service/repo calls
-        # Pattern: service.methodName(...) or repository.methodName(...)
-        pattern = r'(\w+)\.(\w+)\s*\('
-        matches = re.finditer(pattern, self.test_code)
+        for match in _TEST_MULTI.finditer(self.test_code):
+            # One groups() call instead of a group() lookup per name
+            obj, method, args, testfn, entity = match.groups()
+            if method is not None:
+                if obj is not None:
+                    calls[obj].add(method)
+                
+                if args is not None and match.start('call') - 1 >= sig_end:
+                    test_calls[method] = args
+                    sig_end = match.end('args') + 1
+            elif testfn is not None:
+                tests.add(testfn)
+            else:
+                entities.add(entity)
+        
+        return dict(calls), test_calls, tests, entities
+    
+    @cached_property
+    def _impl_scan(self) -> Tuple[Set[str], Dict[str, str], Set[str]]:
+        """Scan implementation code once for defs, signatures and throws."""
+        defs: Set[str] = set()
+        impl_sigs: Dict[str, str] = {}
+        thrown: Set[str] = set()
+        # Same consumed-span rule as for call args
+        sig_end = 0
+        throws_end = 0
         
-        for match in matches:
-            obj = match.group(1)
-            method = match.group(2)
+        for match in _IMPL_MULTI.finditer(self.impl_code):
+            method, params, throws = match.groups()
+            if method is not None:
+                defs.add(method)
+                if params is not None and match.start() >= sig_end:
+                    impl_sigs[method] = params
+                    sig_end = match.end('params') + 1
+            elif match.start() >= throws_end:
+                thrown.update(throws.replace(' ', '').split(','))
+                throws_end = match.end('throws')
+        
+        return defs, impl_sigs, thrown
+    
+    @property
+    def method_calls(self) -> Dict[str, Set[str]]:
+        """Method calls in test code, by receiver."""
+        return self._test_scan[0]
+    
+    @property
+    def test_calls(self) -> Dict[str, str]:
+        """Raw argument text of each method called in test code."""
+        return self._test_scan[1]
+    
+    @property
+    def test_methods(self) -> Set[str]:
+        """Test method names in test code."""
+        return self._test_scan[2]
+    
+    @property
+    def tested_entities(self) -> Set[str]:
+        """Entity classes under test."""
+        return self._test_scan[3]
+    
+    @property
+    def method_defs(self) -> Set[str]:
+        """Method names defined in implementation code."""
+        return self._impl_scan[0]
+    
+    @property
+    def impl_sigs(self) -> Dict[str, str]:
+        """Raw parameter text of each method defined in implementation code."""
+        return self._impl_scan[1]
+    
+    @property
+    def thrown_exceptions(self) -> Set[str]:
+        """Exceptions declared in implementation throws clauses."""
+        return self._impl_scan[2]
+    
+    @cached_property
+    def tested_exceptions(self) -> Set[str]:
+        """Exceptions asserted via assertThatThrownBy in test code."""
+        text = self.test_code
+        size = len(text)
+        tested = set()
+        pos = 0
+        
+        while True:
+            start = text.find(_ASSERT_START, pos)
+            if start < 0:
+                break
+            
+            # First .isInstanceOf( directly followed by an identifier
+            idx = text.find(_ASSERT_TYPE, start + len(_ASSERT_START))
+            while idx >= 0:
+                name_start = name_end = idx + len(_ASSERT_TYPE)
+                while name_end < size and (text[name_end].isalnum() or text[name_end] == '_'):
+                    name_end += 1
+                if name_end > name_start:
+                    break
+                idx = text.find(_ASSERT_TYPE, idx + 1)
+            if idx < 0:
+                break
             
-            if obj not in calls_by_class:
-                calls_by_class[obj] = set()
-            calls_by_class[obj].add(method)
+            tested.add(text[name_start:name_end])
+            pos = name_end
         
-        return calls_by_class
+        return tested
+    
+    def extract_method_calls(self) -> Dict[str, Set[str]]:
+        """Extract method calls from test code by class."""
+        # Copies, so callers can't alter what the validators read
+        return {obj: set(methods) for obj, methods in self.method_calls.items()}
     
     def extract_method_defs(self) -> Set[str]:
         """Extract method definitions from implementation code."""
-        defs = set()
-        
-        # Pattern: fun methodName(...) or def methodName(...)
-        pattern = r'fun\s+(\w+)\s*\('
-        matches = re.finditer(pattern, self.impl_code)
-        
-        for match in matches:
-            defs.add(match.group(1))
-        
-        return defs
+        return set(self.method_defs)
     
     def extract_test_methods(self) -> Set[str]:
         """Extract test method names from test code."""
-        tests = set()
-        
-        # Pattern: fun testName(...) or @Test fun method()
-        pattern = r'fun\s+((?:test|should|when)\w*)\s*\('
-        matches = re.finditer(pattern, self.test_code)
-        
-        for match in matches:
-            tests.add(match.group(1))
-        
-        return tests
+        return set(self.test_methods)
     
     def extract_entities_from_tests(self) -> Set[str]:
         """Extract entity classes being tested."""
-        entities = set()
-        
-        # Pattern: @Test class ..Test or when testing ...Service
-        pattern = r'class\s+(\w+)(?:ServiceTest|RepositoryTest|ControllerTest)'
-        matches = re.finditer(pattern, self.test_code)
-        
-        for match in matches:
-            entity = match.group(1)
-            entities.add(entity)
-        
-        return entities
+        return set(self.tested_entities)
     
     def validate_method_match(self) -> bool:
         """Validate that all tested methods exist in implementation."""
-        calls = self.extract_method_calls()
-        defs = self.extract_method_defs()
+        calls = self.method_calls
+        defs = self.method_defs
         
         for obj, methods in calls.items():
             for method in methods:
                 # Skip common helpers
-                if method in ['assertEquals', 'assertTrue', 'assertFalse', 'reset', 'given', 'verify']:
+                if method in _HELPER_METHODS:
                     continue
                 
                 if method not in defs:
@@ -102,20 +214,17 @@ class TestImplMatcher:
     
     def validate_test_coverage(self) -> bool:
         """Check if all public methods have tests."""
-        defs = self.extract_method_defs()
-        calls = self.extract_method_calls()
-        
-        all_called_methods = set()
-        for methods in calls.values():
-            all_called_methods.update(methods)
+        defs = self.method_defs
+        if not defs:
+            return True
         
         # Skip private and helper methods
-        public_methods = {m for m in defs if not m.startswith('_')}
+        public_methods = {m for m in defs if not m.startswith('_')} - _OBJECT_METHODS
+        if not public_methods:
+            return True
         
+        all_called_methods = set().union(*self.method_calls.values())
         uncovered = public_methods - all_called_methods
-        uncovered = {m for m in uncovered if m not in [
-            'equals', 'hashCode', 'toString', 'getClass'
-        ]}
         
         if uncovered:
             self.warnings.append(
@@ -126,24 +235,7 @@ class TestImplMatcher:
     
     def validate_exception_handling(self) -> bool:
         """Check that thrown exceptions are tested."""
-        # Find throws declarations
-        throws_pattern = r'throws\s+(\w+(?:\s*,\s*\w+)*)'
-        throws_matches = re.finditer(throws_pattern, self.impl_code)
-        
-        thrown_exceptions = set()
-        for match in throws_matches:
-            exc = match.group(1)
-            thrown_exceptions.update(exc.replace(' ', '').split(','))
-        
-        # Find exception tests
-        test_pattern = r'assertThatThrownBy.*?\.isInstanceOf\((\w+)'
-        test_matches = re.finditer(test_pattern, self.test_code, re.DOTALL)
-        
-        tested_exceptions = set()
-        for match in test_matches:
-            tested_exceptions.add(match.group(1))
-        
-        untested = thrown_exceptions - tested_exceptions
+        untested = self.thrown_exceptions - self.tested_exceptions
         if untested:
             self.warnings.append(
                 f"Exceptions declared but not tested: {untested}"
@@ -153,20 +245,10 @@ class TestImplMatcher:
     
     def validate_signature_match(self) -> bool:
         """Check method signatures match between test and implementation."""
-        # Extract method signatures from both
-        impl_pattern = r'fun\s+(\w+)\s*\((.*?)\)'
-        test_pattern = r'\.(\w+)\s*\((.*?)\)'
-        
-        impl_sigs = {}
-        for match in re.finditer(impl_pattern, self.impl_code):
-            impl_sigs[match.group(1)] = match.group(2)
-        
-        test_calls = {}
-        for match in re.finditer(test_pattern, self.test_code):
-            test_calls[match.group(1)] = match.group(2)
+        impl_sigs = self.impl_sigs
         
         # Check for parameter count mismatches
-        for method, test_params in test_calls.items():
+        for method, test_params in self.test_calls.items():
             if method in impl_sigs:
                 impl_params = impl_sigs[method]
                 test_param_count = len([p for p in test_params.split(',') if p.strip()])
@@ -201,8 +283,9 @@ class TestImplMatcher:
 def validate_files(test_file: Path, impl_file: Path) -> Dict:
     """Validate test and implementation files."""
     try:
-        test_code = test_file.read_text()
-        impl_code = impl_file.read_text()
+        # Kotlin sources are UTF-8; undecodable bytes must not abort validation
+        test_code = test_file.read_text(encoding='utf-8', errors='replace')
+        impl_code = impl_file.read_text(encoding='utf-8', errors='replace')
     except FileNotFoundError as e:
         return {
             'success': False,